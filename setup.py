@@ -73,6 +73,7 @@ setup_args = dict(
         "urllib3>=1.26.19",
         "fsspec>=2024.6.1",
         "ujson>=5.4.0",
+        "orjson>=3.8.0",
         "deprecation>=2.1.0",
         "uuid6>=2024.7.10",
         "cryptography>=43.0.1",
@@ -192,3 +192,4 @@ class Version(BaseModel):
     application: str
     version: str
     commit: str
+    request_encodings: List[str] = []
@@ -6,6 +6,7 @@ from litestar import get
 
 import evidently
 from evidently.ui.api.models import Version
+from evidently.ui.utils import REQUEST_ENCODINGS
 
 EVIDENTLY_APPLICATION_NAME = "Evidently UI"
 
@@ -16,6 +17,7 @@ async def version() -> Version:
         application=EVIDENTLY_APPLICATION_NAME,
         version=evidently.__version__,
         commit=get_git_revision_short_hash(os.path.dirname(evidently.__file__)) or "-",
+        request_encodings=REQUEST_ENCODINGS,
     )
 
 
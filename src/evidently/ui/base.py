@@ -3,6 +3,7 @@ import contextlib
 import datetime
 import json
 import threading
+import weakref
 from abc import ABC
 from abc import abstractmethod
 from enum import Enum
@@ -68,21 +69,38 @@ _thr = threading.Thread(target=_loop.run_forever, name="Async Runner", daemon=Tr
 TA = TypeVar("TA")
 
 
+class _ThreadLoop:
+    """Event loop owned by a thread, closed when the thread exits and its thread-local data is released"""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        weakref.finalize(self, self.loop.close)
+
+
+_thread_loops = threading.local()
+
+
+def _get_thread_loop() -> asyncio.AbstractEventLoop:
+    # reuse one loop per thread instead of creating and closing a new one for every sync call
+    holder: Optional[_ThreadLoop] = getattr(_thread_loops, "holder", None)
+    if holder is None or holder.loop.is_closed():
+        holder = _ThreadLoop()
+        _thread_loops.holder = holder
+    return holder.loop
+
+
 def async_to_sync(awaitable: Awaitable[TA]) -> TA:
     try:
         asyncio.get_running_loop()
-        # we are in sync context but inside a running loop
-        if not _thr.is_alive():
-            _thr.start()
-        future = asyncio.run_coroutine_threadsafe(awaitable, _loop)
-        return future.result()
     except RuntimeError:
-        new_loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(new_loop)
-        try:
-            return new_loop.run_until_complete(awaitable)
-        finally:
-            new_loop.close()
+        loop = _get_thread_loop()
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(awaitable)
+    # we are in sync context but inside a running loop
+    if not _thr.is_alive():
+        _thr.start()
+    future = asyncio.run_coroutine_threadsafe(awaitable, _loop)
+    return future.result()
 
 
 class BlobMetadata(BaseModel):
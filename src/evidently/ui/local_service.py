@@ -3,6 +3,7 @@ import time
 
 from litestar import Request
 from litestar import Response
+from litestar.config.compression import CompressionConfig
 from litestar.logging import LoggingConfig
 
 from evidently.ui.api.projects import create_projects_api
@@ -19,6 +20,7 @@ from evidently.ui.components.telemetry import TelemetryComponent
 from evidently.ui.config import AppConfig
 from evidently.ui.config import ConfigContext
 from evidently.ui.errors import EvidentlyServiceError
+from evidently.ui.utils import gzip_request_middleware
 
 
 def evidently_service_exception_handler(_: Request, exc: EvidentlyServiceError) -> Response:
@@ -35,11 +37,15 @@ class LocalServiceComponent(ServiceComponent):
     def get_route_handlers(self, ctx: ComponentContext):
         return [assets_router()]
 
+    def get_middlewares(self, ctx: ComponentContext):
+        return [gzip_request_middleware]
+
     def apply(self, ctx: ComponentContext, builder: AppBuilder):
         super().apply(ctx, builder)
         assert isinstance(ctx, ConfigContext)
         builder.exception_handlers[EvidentlyServiceError] = evidently_service_exception_handler
         builder.kwargs["debug"] = self.debug
+        builder.kwargs["compression_config"] = CompressionConfig(backend="gzip")
         if self.debug:
             log_config = create_logging()
             builder.kwargs["logging_config"] = LoggingConfig(**log_config)
@@ -1,5 +1,6 @@
 import json
 import urllib.parse
+import zlib
 from typing import Any
 from typing import Optional
 from typing import Type
@@ -7,6 +8,12 @@ from typing import TypeVar
 from typing import Union
 
 import requests
+from litestar.exceptions import HTTPException
+from litestar.types import ASGIApp
+from litestar.types import Message
+from litestar.types import Receive
+from litestar.types import Scope
+from litestar.types import Send
 
 from evidently._pydantic_compat import BaseModel
 from evidently._pydantic_compat import parse_obj_as
@@ -48,3 +55,62 @@ class RemoteClientBase:
 
 def parse_json(body: bytes) -> Any:
     return json.loads(body)
+
+
+# content encodings of request bodies that gzip_request_middleware can decode
+REQUEST_ENCODINGS = ["gzip"]
+
+
+# decompressed body is passed on in messages of at most this size, so that litestar enforces
+# request_max_body_size on inflated bytes before the whole compressed payload is decompressed
+_DECOMPRESS_CHUNK_SIZE = 64 * 1024
+
+
+def _is_gzip_encoded(headers) -> bool:
+    for name, value in headers:
+        if name.lower() == b"content-encoding":
+            return value.split(b";", 1)[0].strip().lower() == b"gzip"
+    return False
+
+
+def gzip_request_middleware(app: ASGIApp) -> ASGIApp:
+    async def middleware(scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _is_gzip_encoded(scope["headers"]):
+            await app(scope, receive, send)
+            return
+        # wbits=31 accepts gzip container only
+        decompressor = zlib.decompressobj(wbits=31)
+        scope["headers"] = [
+            (k, v) for k, v in scope["headers"] if k.lower() not in (b"content-encoding", b"content-length")
+        ]
+        tail = b""
+        received_all = False
+        done = False
+
+        async def decompressing_receive() -> Message:
+            nonlocal tail, received_all, done
+            if done:
+                return await receive()
+            while not tail and not received_all:
+                message = await receive()
+                if message["type"] != "http.request":
+                    return message
+                tail = message.get("body", b"")
+                received_all = not message.get("more_body", False)
+            try:
+                body = decompressor.decompress(tail, _DECOMPRESS_CHUNK_SIZE)
+                tail = decompressor.unconsumed_tail
+                if not tail and received_all:
+                    body += decompressor.flush()
+                    done = True
+            except zlib.error as e:
+                raise HTTPException(status_code=400, detail="invalid gzip request body") from e
+            if decompressor.unused_data:
+                raise HTTPException(status_code=400, detail="unexpected data after gzip request body")
+            if done and not decompressor.eof:
+                raise HTTPException(status_code=400, detail="truncated gzip request body")
+            return {"type": "http.request", "body": body, "more_body": not done}
+
+        await app(scope, decompressing_receive, send)
+
+    return middleware
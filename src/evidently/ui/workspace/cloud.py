@@ -39,6 +39,7 @@ from evidently.ui.workspace.remote import NoopBlobStorage
 from evidently.ui.workspace.remote import NoopDataStorage
 from evidently.ui.workspace.remote import RemoteMetadataStorage
 from evidently.ui.workspace.remote import T
+from evidently.ui.workspace.remote import _json
 from evidently.ui.workspace.view import WorkspaceView
 
 TOKEN_HEADER_NAME = "X-Evidently-Token"
@@ -75,30 +76,6 @@ class CloudMetadataStorage(RemoteMetadataStorage):
 
         return self._jwt_token
 
-    def _prepare_request(
-        self,
-        path: str,
-        method: str,
-        query_params: Optional[dict] = None,
-        body: Optional[dict] = None,
-        cookies=None,
-        headers: Dict[str, str] = None,
-        form_data: bool = False,
-    ):
-        r = super()._prepare_request(
-            path=path,
-            method=method,
-            query_params=query_params,
-            body=body,
-            cookies=cookies,
-            headers=headers,
-            form_data=form_data,
-        )
-        if path == "/api/users/login":
-            return r
-        r.cookies[self.token_cookie_name] = self.jwt_token
-        return r
-
     @overload
     def _request(
         self,
@@ -138,6 +115,7 @@ class CloudMetadataStorage(RemoteMetadataStorage):
         headers: Dict[str, str] = None,
         form_data: bool = False,
     ) -> Union[Response, T]:
+        cookies = {**(cookies or {}), self.token_cookie_name: self.jwt_token}
         try:
             res = super()._request(
                 path=path,
@@ -204,7 +182,7 @@ class CloudMetadataStorage(RemoteMetadataStorage):
             query_params={"org_id": org_id, "team_id": team_id},
             form_data=True,
         )
-        return DatasetID(response.json()["dataset_id"])
+        return DatasetID(_json(response)["dataset_id"])
 
     def load_dataset(self, dataset_id: DatasetID) -> pd.DataFrame:
         response: Response = self._request(f"/api/datasets/{dataset_id}/download", "GET")
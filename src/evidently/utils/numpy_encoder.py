@@ -49,6 +49,15 @@ class NumpyEncoder(json.JSONEncoder):
         If we cannot convert the object, leave the default `JSONEncoder` behaviour - raise a TypeError exception.
         """
 
+        # fast path for the most frequent numpy values before walking through the mapping rules
+        if isinstance(o, np.floating):
+            return float(o)
+        # timedelta64 is a subclass of np.integer, but it is not encoded as int (NaT maps to null below)
+        if isinstance(o, np.integer) and not isinstance(o, np.timedelta64):
+            return int(o)
+        if isinstance(o, np.ndarray):
+            return o.tolist()
+
         # check mapping rules
         for types_list, python_type in _TYPES_MAPPING:
             if isinstance(o, types_list):
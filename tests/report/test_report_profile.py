@@ -21,29 +21,31 @@ def data():
     return ref, curr
 
 
-def test_report_loading(data):
+def test_report_loading(data, tmp_path):
     ref, curr = data
 
     report = Report(metrics=[ClassificationPreset(probas_threshold=0.7)])
 
     report.run(reference_data=ref, current_data=curr)
 
-    report.save("profile.json")
+    path = str(tmp_path / "profile.json")
+    report.save(path)
 
-    report2 = Report.load("profile.json")
+    report2 = Report.load(path)
 
     assert report2.as_dict() == report.as_dict()
 
 
-def test_suite_loading(data):
+def test_suite_loading(data, tmp_path):
     ref, curr = data
 
     ts = TestSuite([BinaryClassificationTestPreset()])
 
     ts.run(reference_data=ref, current_data=curr)
     ts._inner_suite.raise_for_error()
-    ts.save("profile.json")
+    path = str(tmp_path / "profile.json")
+    ts.save(path)
 
-    ts2 = TestSuite.load("profile.json")
+    ts2 = TestSuite.load(path)
 
     assert ts2.as_dict() == ts.as_dict()
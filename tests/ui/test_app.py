@@ -1,4 +1,5 @@
 import datetime
+import gzip
 import json
 import os
 import time
@@ -30,6 +31,8 @@ from evidently.ui.dashboards import ReportFilter
 from evidently.ui.dashboards.base import DashboardPanel
 from evidently.ui.storage.local import FSSpecBlobStorage
 from evidently.ui.type_aliases import ZERO_UUID
+from evidently.ui.utils import _DECOMPRESS_CHUNK_SIZE
+from evidently.ui.utils import gzip_request_middleware
 from evidently.utils import NumpyEncoder
 from tests.ui.conftest import HEADERS
 from tests.ui.conftest import _dumps
@@ -181,6 +184,82 @@ async def test_add_snapshot(test_client: TestClient, project_manager: ProjectMan
     assert snapshots[0].id == mock_snapshot.id
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("content_encoding", ["gzip", "GZIP", "gzip; q=1"])
+async def test_add_snapshot_gzip(
+    test_client: TestClient, project_manager: ProjectManager, mock_project, mock_snapshot, content_encoding
+):
+    """post /api/projects/{project_id}/snapshots with gzip-encoded body"""
+    project = await project_manager.add_project(mock_project, ZERO_UUID, ZERO_UUID)
+
+    r = test_client.post(
+        f"/api/projects/{project.id}/snapshots",
+        content=gzip.compress(_dumps(mock_snapshot).encode("utf8")),
+        headers={**HEADERS, "Content-Encoding": content_encoding},
+    )
+    r.raise_for_status()
+
+    snapshots = await project_manager.list_snapshots(ZERO_UUID, project.id)
+    assert len(snapshots) == 1
+    assert snapshots[0].id == mock_snapshot.id
+
+
+@pytest.mark.asyncio
+async def test_add_snapshot_gzip_too_large(test_client: TestClient, project_manager: ProjectManager, mock_project):
+    """post /api/projects/{project_id}/snapshots with gzip-encoded body inflating over the size limit"""
+    project = await project_manager.add_project(mock_project, ZERO_UUID, ZERO_UUID)
+
+    r = test_client.post(
+        f"/api/projects/{project.id}/snapshots",
+        content=gzip.compress(b" " * 50_000_000),
+        headers={**HEADERS, "Content-Encoding": "gzip"},
+    )
+    assert r.status_code == 413
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"not gzip at all",
+        gzip.compress(b"{}") + b"trailing",
+        gzip.compress(b"{}") + gzip.compress(b"{}"),
+        gzip.compress(b"{}")[:-4],
+    ],
+)
+async def test_add_project_gzip_invalid(test_client: TestClient, content):
+    """post /api/projects with malformed gzip-encoded body"""
+    r = test_client.post("/api/projects", content=content, headers={**HEADERS, "Content-Encoding": "gzip"})
+    assert r.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_gzip_request_middleware_decompresses_in_chunks():
+    body = b" " * 1_000_000
+    compressed = gzip.compress(body)
+    messages = [
+        {"type": "http.request", "body": compressed[:10], "more_body": True},
+        {"type": "http.request", "body": compressed[10:], "more_body": False},
+    ]
+    received = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def app(scope, receive, send):
+        while True:
+            message = await receive()
+            received.append(message["body"])
+            if not message["more_body"]:
+                break
+
+    middleware = gzip_request_middleware(app)
+    await middleware({"type": "http", "headers": [(b"content-encoding", b"gzip")]}, receive, None)
+
+    assert b"".join(received) == body
+    assert max(len(chunk) for chunk in received) <= _DECOMPRESS_CHUNK_SIZE
+
+
 @pytest.mark.asyncio
 async def test_delete_snapshot(test_client: TestClient, project_manager: ProjectManager, mock_project, mock_snapshot):
     """delete /api/projects/{project_id}/{snapshot_id}"""
@@ -433,3 +512,4 @@ def test_api_version(test_client):
     version_response = response.json()
     assert "version" in version_response
     assert version_response["application"] == "Evidently UI"
+    assert "gzip" in version_response["request_encodings"]
@@ -0,0 +1,60 @@
+import gc
+import threading
+
+import pytest
+
+from evidently.ui.base import _get_thread_loop
+from evidently.ui.base import async_to_sync
+
+
+def test_async_to_sync_runtime_error_runs_once():
+    calls = []
+
+    async def coro():
+        calls.append(1)
+        raise RuntimeError("failed")
+
+    with pytest.raises(RuntimeError, match="failed"):
+        async_to_sync(coro())
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_async_to_sync_runtime_error_in_running_loop_runs_once():
+    calls = []
+
+    async def coro():
+        calls.append(1)
+        raise RuntimeError("failed")
+
+    with pytest.raises(RuntimeError, match="failed"):
+        async_to_sync(coro())
+    assert calls == [1]
+
+
+def test_async_to_sync_reuses_thread_loop():
+    async def coro():
+        return 1
+
+    assert async_to_sync(coro()) == 1
+    loop = _get_thread_loop()
+    assert async_to_sync(coro()) == 1
+    assert _get_thread_loop() is loop
+
+
+def test_thread_loop_closed_on_thread_exit():
+    loops = []
+
+    async def coro():
+        return 1
+
+    def run():
+        async_to_sync(coro())
+        loops.append(_get_thread_loop())
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+    gc.collect()
+
+    assert loops[0].is_closed()
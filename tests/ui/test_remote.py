@@ -0,0 +1,334 @@
+import gzip
+import io
+import json
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+import pytest
+import requests
+from litestar.testing import TestClient
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from evidently.core import new_id
+from evidently.metrics import DatasetSummaryMetric
+from evidently.report import Report
+from evidently.ui.base import ProjectManager
+from evidently.ui.dashboards import CounterAgg
+from evidently.ui.dashboards import DashboardPanelCounter
+from evidently.ui.dashboards import ReportFilter
+from evidently.ui.errors import EvidentlyServiceError
+from evidently.ui.errors import ProjectNotFound
+from evidently.ui.type_aliases import ZERO_UUID
+from evidently.ui.workspace.remote import COMPRESS_BODY_THRESHOLD
+from evidently.ui.workspace.remote import RemoteBase
+from evidently.ui.workspace.remote import RemoteMetadataStorage
+from evidently.ui.workspace.remote import RemoteWorkspaceView
+from evidently.ui.workspace.remote import _dumps
+from evidently.ui.workspace.remote import _GatewayRetry
+from evidently.utils import NumpyEncoder
+
+
+class TestClientAdapter(BaseAdapter):
+    """Transport adapter that sends requests made by remote storage to litestar test client"""
+
+    def __init__(self, client: TestClient):
+        super().__init__()
+        self.client = client
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        body = request.body
+        if hasattr(body, "read"):
+            body = body.read()
+        self.sent.append((request, body))
+        r = self.client.request(request.method, request.url, content=body, headers=dict(request.headers))
+        response = requests.Response()
+        response.status_code = r.status_code
+        response._content = r.content
+        response.headers = CaseInsensitiveDict(r.headers)
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def adapter(test_client: TestClient):
+    return TestClientAdapter(test_client)
+
+
+@pytest.fixture
+def remote(adapter: TestClientAdapter):
+    storage = RemoteMetadataStorage(str(adapter.client.base_url))
+    storage._session.mount("http://", adapter)
+    return storage
+
+
+@pytest.fixture
+def remote_workspace(adapter: TestClientAdapter, monkeypatch):
+    create_session = RemoteBase._create_session
+
+    def _create_session(self):
+        session = create_session(self)
+        session.mount("http://", adapter)
+        return session
+
+    monkeypatch.setattr(RemoteBase, "_create_session", _create_session)
+    return RemoteWorkspaceView(str(adapter.client.base_url))
+
+
+def _snapshot():
+    report = Report(metrics=[DatasetSummaryMetric()])
+    report.run(reference_data=None, current_data=pd.DataFrame({"a": [1, 2]}))
+    return report.to_snapshot()
+
+
+def _panel():
+    return DashboardPanelCounter(
+        title="panel",
+        filter=ReportFilter(metadata_values={}, tag_values=[], include_test_suites=True),
+        agg=CounterAgg.NONE,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_project_cache(remote: RemoteMetadataStorage, project_manager: ProjectManager, mock_project):
+    project = await project_manager.add_project(mock_project, ZERO_UUID, ZERO_UUID)
+    assert (await remote.get_project(project.id)).name == "mock"
+
+    project.name = "changed"
+    await project_manager.update_project(ZERO_UUID, project)
+    assert (await remote.get_project(project.id)).name == "mock"
+
+    remote._project_ttl = 0
+    assert (await remote.get_project(project.id)).name == "changed"
+
+
+@pytest.mark.asyncio
+async def test_get_project_cache_returns_copy(
+    remote: RemoteMetadataStorage, project_manager: ProjectManager, mock_project
+):
+    project = await project_manager.add_project(mock_project, ZERO_UUID, ZERO_UUID)
+
+    local = await remote.get_project(project.id)
+    local.dashboard.add_panel(_panel())
+
+    assert (await remote.get_project(project.id)).dashboard.panels == []
+
+
+@pytest.mark.asyncio
+async def test_update_project_invalidates_cache(
+    remote: RemoteMetadataStorage, project_manager: ProjectManager, mock_project
+):
+    project = await project_manager.add_project(mock_project, ZERO_UUID, ZERO_UUID)
+    local = await remote.get_project(project.id)
+
+    local.dashboard.add_panel(_panel())
+    await remote.update_project(local)
+
+    assert len((await remote.get_project(project.id)).dashboard.panels) == 1
+
+
+def _response(status_code: int, content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    return response
+
+
+@pytest.mark.parametrize(
+    "status_code,content,error",
+    [
+        (400, b'{"detail": "bad request"}', EvidentlyServiceError),
+        (500, b'["not", "a", "dict"]', requests.HTTPError),
+        (502, b"<html>Bad Gateway</html>", requests.HTTPError),
+        (500, b'{"error": "no detail"}', requests.HTTPError),
+    ],
+)
+def test_error_response(status_code, content, error):
+    with pytest.raises(error) as e:
+        RemoteBase("http://test")._handle_response(_response(status_code, content), None)
+    if error is EvidentlyServiceError:
+        assert e.value.args == ("bad request",)
+
+
+def test_error_response_parsed_once(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("error body parsed twice")
+
+    monkeypatch.setattr(json, "loads", fail)
+    with pytest.raises(requests.HTTPError):
+        RemoteBase("http://test")._handle_response(_response(502, b"<html>Bad Gateway</html>"), None)
+
+
+def test_dumps():
+    body = {"value": np.float64(1.5), "values": np.arange(3), "nan": float("nan")}
+    assert _dumps(body) == json.dumps(body, allow_nan=True, cls=NumpyEncoder).encode("utf8")
+
+
+@pytest.mark.asyncio
+async def test_add_project_gzip(remote: RemoteMetadataStorage, adapter: TestClientAdapter, mock_project):
+    remote._negotiate()
+    assert remote._request_encoding == "gzip"
+
+    mock_project.description = "x" * COMPRESS_BODY_THRESHOLD * 2
+    project = await remote.add_project(mock_project, None, None)
+
+    request, body = adapter.sent[-1]
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert int(request.headers["Content-Length"]) == len(body)
+    assert json.loads(gzip.decompress(body))["description"] == mock_project.description
+    assert (await remote.get_project(project.id)).description == mock_project.description
+
+
+@pytest.mark.asyncio
+async def test_add_project_not_compressed(remote: RemoteMetadataStorage, adapter: TestClientAdapter, mock_project):
+    mock_project.description = "x" * COMPRESS_BODY_THRESHOLD * 2
+    await remote.add_project(mock_project, None, None)
+
+    request, body = adapter.sent[-1]
+    assert "Content-Encoding" not in request.headers
+    assert json.loads(body)["description"] == mock_project.description
+
+
+def test_form_data_body_not_mutated(monkeypatch):
+    remote = RemoteBase("http://test")
+    sent = []
+    monkeypatch.setattr(remote._session, "send", lambda request, **kwargs: sent.append(request) or _response(200, b""))
+    file = io.BytesIO(b"data")
+    body = {"file": file, "name": "dataset"}
+
+    remote._request("/api/datasets", "POST", body=body, form_data=True)
+
+    assert body == {"file": file, "name": "dataset"}
+    assert b'name="name"' in sent[0].body and b'name="file"' in sent[0].body
+
+
+@pytest.mark.asyncio
+async def test_get_project_missing(remote: RemoteMetadataStorage):
+    assert await remote.get_project(new_id()) is None
+
+
+@pytest.mark.asyncio
+async def test_list_snapshots_missing_project(remote: RemoteMetadataStorage):
+    with pytest.raises(ProjectNotFound):
+        await remote.list_snapshots(new_id())
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot_metadata_missing_project(remote: RemoteMetadataStorage):
+    with pytest.raises(ProjectNotFound):
+        await remote.get_snapshot_metadata(new_id(), new_id())
+
+
+def test_other_not_found_errors_not_mapped_to_project():
+    with pytest.raises(EvidentlyServiceError) as e:
+        RemoteBase("http://test")._handle_response(_response(404, b'{"detail": "Snapshot not found"}'), None)
+    assert not isinstance(e.value, ProjectNotFound)
+    assert e.value.args == ("Snapshot not found",)
+
+
+@pytest.mark.asyncio
+async def test_list_all_snapshots(remote: RemoteMetadataStorage, project_manager: ProjectManager, project_factory):
+    first = await project_manager.add_project(project_factory("first"), ZERO_UUID, ZERO_UUID)
+    second = await project_manager.add_project(project_factory("second"), ZERO_UUID, ZERO_UUID)
+    snapshots = [_snapshot(), _snapshot()]
+    for snapshot in snapshots:
+        await project_manager.add_snapshot(ZERO_UUID, first.id, snapshot)
+
+    result = await remote.list_all_snapshots([first.id, second.id])
+
+    assert {s.id for s in result[first.id]} == {s.id for s in snapshots}
+    assert all(s.project.id == first.id for s in result[first.id])
+    assert result[second.id] == []
+
+    with pytest.raises(ProjectNotFound):
+        await remote.list_all_snapshots([first.id, new_id()])
+
+
+def test_workspace_list_all_snapshots(remote_workspace: RemoteWorkspaceView, project_factory):
+    first = remote_workspace.add_project(project_factory("first"))
+    second = remote_workspace.add_project(project_factory("second"))
+    snapshot = _snapshot()
+    remote_workspace.add_snapshot(first.id, snapshot)
+
+    result = remote_workspace.list_all_snapshots([str(first.id), second.id])
+
+    assert [s.id for s in result[first.id]] == [snapshot.id]
+    assert result[first.id][0].project.project_manager is remote_workspace.project_manager
+    assert result[second.id] == []
+
+    with pytest.raises(ProjectNotFound):
+        remote_workspace.list_all_snapshots([first.id, new_id()])
+
+
+@pytest.fixture
+def status_server(monkeypatch):
+    """Local http server answering with queued statuses, to exercise retries of the pooled session"""
+    monkeypatch.setattr(_GatewayRetry, "get_backoff_time", lambda self: 0)
+    statuses = []
+    calls = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def _respond(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            self.rfile.read(length)
+            calls.append(self.command)
+            status = statuses.pop(0) if statuses else 200
+            body = b'{"detail": "unavailable"}' if status == 503 else b"<html>error</html>" if status >= 400 else b"{}"
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = do_POST = do_DELETE = _respond
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", statuses, calls
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("method", ["GET", "POST", "DELETE"])
+def test_retry_unavailable(status_server, method):
+    url, statuses, calls = status_server
+    statuses.extend([503, 200])
+    body = {"a": 1} if method == "POST" else None
+
+    assert RemoteBase(url)._request("/api/test", method, body=body, response_model=dict) == {}
+    assert calls == [method, method]
+
+
+def test_retry_unavailable_exhausted(status_server):
+    url, statuses, calls = status_server
+    statuses.extend([503] * 10)
+
+    with pytest.raises(EvidentlyServiceError, match="unavailable"):
+        RemoteBase(url)._request("/api/test", "GET")
+    assert len(calls) == 6
+
+
+@pytest.mark.parametrize("status_code", [502, 504])
+def test_retry_gateway_error(status_server, status_code):
+    url, statuses, calls = status_server
+    statuses.extend([status_code, 200])
+
+    assert RemoteBase(url)._request("/api/test", "GET", response_model=dict) == {}
+    assert calls == ["GET", "GET"]
+
+    calls.clear()
+    statuses.extend([status_code, 200])
+    with pytest.raises(requests.HTTPError):
+        RemoteBase(url)._request("/api/test", "POST", body={"a": 1})
+    assert calls == ["POST"]
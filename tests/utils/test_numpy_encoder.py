@@ -34,6 +34,8 @@ from evidently.utils.types import ApproxValue
         (pd.Timedelta(1), '"0 days 00:00:00.000000001"'),
         (np.void(0), "null"),
         (pd.NaT, "null"),
+        (np.timedelta64("NaT"), "null"),
+        (np.datetime64("NaT"), "null"),
         (pd.Timestamp(year=2000, month=1, day=1), '"2000-01-01T00:00:00"'),
         (datetime.datetime(2000, 1, 1), '"2000-01-01T00:00:00"'),
         (datetime.date(2000, 1, 1), '"2000-01-01"'),
@@ -43,3 +45,8 @@ from evidently.utils.types import ApproxValue
 )
 def test_encoder(value, expected):
     assert json.dumps({"value": value}, cls=NumpyEncoder) == f'{{"value": {expected}}}'
+
+
+def test_encoder_timedelta64_not_int():
+    with pytest.raises(TypeError, match="not JSON serializable"):
+        json.dumps({"value": np.timedelta64(5, "s")}, cls=NumpyEncoder)